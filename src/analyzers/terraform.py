@@ -1,29 +1,31 @@
+import re
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional
+
+import numpy as np
+
 from src.providers.base import GitProvider
 
+# Matched case-insensitively in place, without building a lowercased copy of the message
+SKIP_CI_PATTERN = re.compile(r'\[skip ci\]', re.IGNORECASE)
+
 class TerraformAnalyzer:
     """Analyzer for Terraform-related commits."""
     
     def __init__(self, provider: GitProvider):
         self.provider = provider
-        self.terraform_extensions = {'.tf', '.tfvars', '.tfvars.json'}
+        self.terraform_extensions = ('.tf', '.tfvars', '.tfvars.json')  # Tuple so endswith checks all at once
     
     def is_terraform_file(self, filename: str) -> bool:
         """Check if a file is a Terraform file."""
-        return any(filename.endswith(ext) for ext in self.terraform_extensions)
+        return filename.endswith(self.terraform_extensions)
     
     def is_skip_ci(self, commit) -> bool:
         """Check if commit message contains [skip ci]."""
-        return '[skip ci]' in self.provider.get_commit_message(commit).lower()
+        return SKIP_CI_PATTERN.search(self.provider.get_commit_message(commit)) is not None
     
-    def analyze_repository(self, repo_name: str, start_date: datetime, end_date: datetime, commits: Optional[List[Dict]] = None) -> Dict:
-        """Analyze Terraform commits in a repository."""
-        if commits is None:
-            commits = self.provider.get_commits(repo_name, start_date, end_date)
-            
-        terraform_commits = []
-        
+    def iter_terraform_commits(self, commits: Iterable) -> Iterator[Dict]:
+        """Yield Terraform commits one at a time, skipping [skip ci] commits."""
         for commit in commits:
             if self.is_skip_ci(commit):
                 continue
@@ -32,14 +34,27 @@ class TerraformAnalyzer:
             terraform_files = [f for f in files if self.is_terraform_file(f)]
             
             if terraform_files:
-                terraform_commits.append({
+                yield {
                     'date': self.provider.get_commit_date(commit),
                     'files': terraform_files,
                     'message': self.provider.get_commit_message(commit),
                     'branch': self.provider.get_commit_branch(commit)
-                })
+                }
+    
+    def get_commit_dates(self, commits: Iterable) -> np.ndarray:
+        """Get the dates of Terraform commits as a datetime64 array without keeping the commits."""
+        return np.fromiter((c['date'] for c in self.iter_terraform_commits(commits)), dtype='datetime64[s]')
+    
+    def analyze_repository(self, repo_name: str, start_date: datetime, end_date: datetime, commits: Optional[List[Dict]] = None) -> Dict:
+        """Analyze Terraform commits in a repository."""
+        if commits is None:
+            commits = self.provider.get_commits(repo_name, start_date, end_date)
+            
+        terraform_commits = list(self.iter_terraform_commits(commits))
         
         return {
             'total_commits': len(terraform_commits),
-            'commits': terraform_commits
-        } 
\ No newline at end of file
+            'commits': terraform_commits,
+            # Dense array of the commit dates for vectorized bucketing
+            'dates': np.array([c['date'] for c in terraform_commits], dtype='datetime64[s]')
+        }
\ No newline at end of file
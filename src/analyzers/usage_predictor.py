@@ -1,6 +1,5 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import numpy as np
-from sklearn.linear_model import LinearRegression
 from datetime import datetime, timedelta
 
 class UsagePredictor:
@@ -38,16 +37,9 @@ class UsagePredictor:
                 }
             }
         
-        # Calculate historical trend
-        X = np.array(range(len(monthly_data))).reshape(-1, 1)
-        y = np.array(monthly_data)
-        
-        model = LinearRegression()
-        model.fit(X, y)
-        historical_trend = model.coef_[0]
-        
-        # Calculate variance in historical data
-        variance = np.var(y)
+        # Calculate historical trend and variance in historical data
+        y = np.asarray(monthly_data, dtype=np.float64)
+        historical_trend, variance = self._trend_and_variance(y)
         
         # Calculate base prediction
         last_month = monthly_data[-1]
@@ -73,6 +65,18 @@ class UsagePredictor:
             }
         }
     
+    @staticmethod
+    def _trend_and_variance(y: np.ndarray) -> Tuple[float, float]:
+        """Least-squares slope of y against its month index and the variance of y."""
+        n = len(y)
+        dy = y - y.mean()
+        variance = float(np.dot(dy, dy) / n)
+        if n < 2:
+            return 0.0, variance
+        
+        dx = np.arange(n, dtype=np.float64) - (n - 1) / 2
+        return float(np.dot(dx, dy) / np.dot(dx, dx)), variance
+    
     @staticmethod
     def _calculate_confidence(variance: float, data_points: int) -> str:
         """Calculate confidence level based on data variance and sample size."""
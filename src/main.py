@@ -2,76 +2,72 @@
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+import numpy as np
+
 from src.providers.github import GitHubProvider
 from src.analyzers.terraform import TerraformAnalyzer
 from src.analyzers.usage_predictor import UsagePredictor
 
-def create_monthly_breakdown(start_date: datetime, end_date: datetime, commits: List[Dict]) -> List[int]:
-    """Create monthly breakdown of commits."""
-    # Calculate number of months between dates
-    months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month) + 1
-    monthly_data = []
+def analysis_months(start_date: datetime, end_date: datetime) -> np.ndarray:
+    """Get the calendar months covered by the analysis period as a datetime64[M] array."""
+    return np.arange(np.datetime64(start_date, 'M'), np.datetime64(end_date, 'M') + 1)
+
+def create_monthly_breakdown(start_date: datetime, months: np.ndarray, dates: np.ndarray) -> List[int]:
+    """Create monthly breakdown of commits from their datetime64 commit dates."""
+    if not len(dates):
+        return [0] * len(months)
     
-    current_date = start_date
-    while current_date <= end_date:
-        # Calculate end of current month
-        if current_date.month == 12:
-            month_end = datetime(current_date.year + 1, 1, 1)
-        else:
-            month_end = datetime(current_date.year, current_date.month + 1, 1)
-        
-        # Count commits in this month
-        month_commits = len([
-            c for c in commits 
-            if current_date <= c['date'] < month_end
-        ])
-        monthly_data.append(month_commits)
-        
-        # Move to next month
-        current_date = month_end
+    # Bucket every commit by its calendar month offset in a single vectorized pass
+    month_idx = (dates.astype('datetime64[M]') - months[0]).astype(np.int64)
+    in_range = (dates >= np.datetime64(start_date, 's')) & (month_idx < len(months))
     
-    return monthly_data
+    return np.bincount(month_idx[in_range], minlength=len(months)).tolist()
+
+def month_labels(start_date: datetime, count: int) -> List[str]:
+    """Create 'YYYY-MM' labels for consecutive calendar months starting at start_date."""
+    start_month = np.datetime64(start_date, 'M')
+    return [str(month) for month in np.arange(start_month, start_month + count)]
 
 def predict_usage(monthly_data: List[int]) -> Dict:
     """Predict future usage based on historical data."""
     predictor = UsagePredictor(growth_rate=0.1)  # 10% monthly growth rate
     return predictor.predict_usage(monthly_data)
 
-def analyze_repository(provider: GitHubProvider, repo: Dict, start_date: datetime, end_date: datetime) -> Optional[Dict]:
+def analyze_repository(provider: GitHubProvider, analyzer: TerraformAnalyzer, repo: Dict, start_date: datetime, end_date: datetime, months: np.ndarray, branch: Optional[str] = None) -> Optional[Dict]:
     """Analyze a single repository and return its statistics."""
     print(f"\nAnalyzing repository: {repo['name']}")
     
     # Clone repository
     repo_path = provider.clone_repository(repo['name'], repo)
     if not repo_path:
-        print("Failed to clone repository")
+        print(f"Failed to clone repository {repo['name']}")
         return None
         
     try:
         # Get commits
-        commits = provider.get_commits(repo_path, start_date, end_date, repo['default_branch'])
+        commits = provider.get_commits(repo_path, start_date, end_date, branch)
 
         # Analyze commits
-        print("Analyzing Terraform commits...")
-        analyzer = TerraformAnalyzer(provider)
-        result = analyzer.analyze_repository(repo['name'], start_date, end_date, commits)
-        print(f"Found Terraform {len(result['commits'])} commits")
+        print(f"Analyzing Terraform commits in {repo['name']}...")
+        dates = analyzer.get_commit_dates(commits)
+        print(f"Found {len(dates)} Terraform commits in {repo['name']}")
         
         # Create monthly breakdown
-        monthly_data = create_monthly_breakdown(start_date, end_date, result['commits'])
+        monthly_data = create_monthly_breakdown(start_date, months, dates)
         
         # Generate predictions
         predictions = predict_usage(monthly_data)
         
         return {
             'name': repo['name'],
-            'total_commits': result['total_commits'],
+            'total_commits': len(dates),
             'monthly_data': monthly_data,
             'predictions': predictions,
-            'commits': result['commits']  # Include the commits in the returned statistics
+            'dates': dates  # Commit dates as a datetime64 array for date-range reporting
         }
         
     finally:
@@ -115,14 +111,9 @@ def aggregate_statistics(repo_stats: List[Dict]) -> Dict:
             }
         }
     
-    # Get the length of monthly data from the first repository
-    monthly_length = len(active_repo_stats[0]['monthly_data'])
-    
-    # Sum up all monthly data
-    monthly_data = [0] * monthly_length
-    for stat in active_repo_stats:
-        for i, count in enumerate(stat['monthly_data']):
-            monthly_data[i] += count
+    # Sum up all monthly data; every repository covers the same months
+    monthly_matrix = np.asarray([stat['monthly_data'] for stat in active_repo_stats], dtype=np.int64)
+    monthly_data = monthly_matrix.sum(axis=0).tolist()
     
     # Calculate total commits
     total_commits = sum(stat['total_commits'] for stat in active_repo_stats)
@@ -143,7 +134,11 @@ def main():
     # Get environment variables
     token = os.getenv('GITHUB_TOKEN')
     owner_name = os.getenv('GITHUB_OWNER')
+    branch = os.getenv('GITHUB_BRANCH') or None  # Empty means all branches
     analysis_days = int(os.getenv('ANALYSIS_DAYS', '730'))
+    max_concurrency = max(1, int(os.getenv('MAX_CONCURRENCY', '8')))
+    cache_dir = os.getenv('CACHE_DIR') or None
+    cache_ttl = int(os.getenv('CACHE_TTL', '3600'))
     
     if not token or not owner_name:
         print("Please set GITHUB_TOKEN and GITHUB_OWNER environment variables")
@@ -153,7 +148,7 @@ def main():
     try:
         # Initialize provider
         print(f"\nInitializing GitHub provider for owner: {owner_name}")
-        provider = GitHubProvider(token, owner_name)
+        provider = GitHubProvider(token, owner_name, cache_dir=cache_dir, cache_ttl=cache_ttl)
         
         # Get repositories with Terraform files
         print("\nSearching for repositories with Terraform files...")
@@ -177,12 +172,20 @@ def main():
         
         print(f"Analysis period: {start_date.strftime('%Y-%m-%d') if start_date else 'repository creation'} to {end_date.strftime('%Y-%m-%d')}")
         
-        # Analyze all repositories
-        repo_stats = []
-        for repo in repos:
-            stats = analyze_repository(provider, repo, start_date, end_date)
-            if stats:
-                repo_stats.append(stats)
+        # Analyze repositories concurrently; cloning and git log are I/O bound
+        analyzer = TerraformAnalyzer(provider)
+        months = analysis_months(start_date, end_date)  # Shared month buckets for every repository
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {
+                executor.submit(analyze_repository, provider, analyzer, repo, start_date, end_date, months, branch): repo['name']
+                for repo in repos
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Keep the original repository order in the report
+        repo_stats = [results[repo['name']] for repo in repos if results[repo['name']]]
         
         # Aggregate statistics
         aggregated = aggregate_statistics(repo_stats)
@@ -202,23 +205,14 @@ def main():
         
         print("\nMonthly Breakdown:")
         # Find the earliest commit date from all repositories
-        earliest_date = None
-        for stat in repo_stats:
-            if stat['commits']:
-                repo_earliest = min(commit['date'] for commit in stat['commits'])
-                if earliest_date is None or repo_earliest < earliest_date:
-                    earliest_date = repo_earliest
+        all_dates = [stat['dates'] for stat in repo_stats if len(stat['dates'])]
+        earliest_date = np.concatenate(all_dates).min().astype(datetime) if all_dates else None
         
         # Use the earliest commit date or start_date if specified
-        current_date = start_date if start_date else earliest_date
-        if current_date:
-            for count in aggregated['monthly_data']:
-                print(f"- {current_date.strftime('%Y-%m')}: {count} commits")
-                # Move to next month
-                if current_date.month == 12:
-                    current_date = datetime(current_date.year + 1, 1, 1)
-                else:
-                    current_date = datetime(current_date.year, current_date.month + 1, 1)
+        first_date = start_date if start_date else earliest_date
+        labels = month_labels(first_date, len(aggregated['monthly_data'])) if first_date else []
+        for label, count in zip(labels, aggregated['monthly_data']):
+            print(f"- {label}: {count} commits")
         
         # Print per-repository breakdown
         print("\nPer-Repository Breakdown:")
@@ -264,11 +258,7 @@ def main():
             'active_repositories': aggregated['active_repos'],
             'total_commits': aggregated['total_commits'],
             'average_monthly_commits': sum(aggregated['monthly_data']) / len(aggregated['monthly_data']),
-            'monthly_breakdown': {
-                # Create monthly breakdown using end_date as reference
-                (end_date - timedelta(days=30*(len(aggregated['monthly_data'])-i-1))).strftime('%Y-%m'): count
-                for i, count in enumerate(aggregated['monthly_data'])
-            },
+            'monthly_breakdown': dict(zip(labels, aggregated['monthly_data'])),
             'predictions': aggregated['predictions'],
             'repository_details': {
                 'active': [
@@ -0,0 +1,48 @@
+import os
+import json
+import time
+import threading
+import hashlib
+from typing import Any, Optional
+
+class JsonCache:
+    """Small on-disk cache for JSON-serializable provider responses."""
+
+    def __init__(self, cache_dir: str, ttl: int = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory where cache entries are stored
+            ttl: Maximum age of an entry in seconds (default: 1 hour)
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Get the file path for a cache key."""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if it is missing or expired."""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value in the cache."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"  # Unique per writer thread
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not write cache entry {key}: {str(e)}")
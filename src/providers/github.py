@@ -1,60 +1,89 @@
 import os
 import time
+import threading
 import git
 import subprocess
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from github import Github
 from .base import GitProvider
+from .cache import JsonCache
+
+# Control characters that delimit commit headers in git log output
+RECORD_SEPARATOR = '\x1e'
+FIELD_SEPARATOR = '\x1f'
 
 class GitHubProvider(GitProvider):
     """GitHub provider implementation."""
     
-    def __init__(self, token: str, owner_name: str, clone_dir: str = "temp_repos"):
-        self.client = Github(token)
+    def __init__(self, token: str, owner_name: str, clone_dir: str = "temp_repos", cache_dir: Optional[str] = None, cache_ttl: int = 3600):
+        self.client = Github(token, per_page=100)  # Largest page size GitHub allows, fewest search pages
         self.owner_name = owner_name
         self.clone_dir = clone_dir
         self.token = token  # Store token for authentication
+        self._rate_limit_lock = threading.Lock()  # Shared across analysis threads
         os.makedirs(clone_dir, exist_ok=True)
+        self.cache = JsonCache(cache_dir or os.path.join(clone_dir, '.cache'), ttl=cache_ttl)
+        self._repositories: Dict[Tuple[str, str], List[Dict]] = {}  # In-memory results per (sort, direction)
         
-        # Determine if owner is an organization or user
-        try:
-            self.owner = self.client.get_organization(owner_name)
-            self.is_org = True
-        except:
-            self.owner = self.client.get_user(owner_name)
-            self.is_org = False
+        # Determine if owner is an organization or user; the users endpoint resolves both
+        cache_key = f"owner-type-{owner_name}"
+        owner_type = self.cache.get(cache_key)
+        if owner_type is None:
+            owner_type = self.client.get_user(owner_name).type
+            self.cache.put(cache_key, owner_type)
+        self.is_org = owner_type == 'Organization'
     
     def get_repositories(self, sort: str = 'updated', direction: str = 'desc') -> List[Dict]:
         """Get list of repositories that contain Terraform files."""
+        if (sort, direction) in self._repositories:
+            return list(self._repositories[(sort, direction)])
+        
+        cache_key = f"repos-{self.owner_name}-{sort}-{direction}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            print("Using cached repository list")
+            result = [{**repo, 'updated_at': datetime.fromisoformat(repo['updated_at'])} for repo in cached]
+            self._repositories[(sort, direction)] = result
+            return list(result)
+        
         self.handle_rate_limit()
         
         # Search for repositories containing Terraform files
         query = f'{"org" if self.is_org else "user"}:{self.owner_name} language:hcl'
         repos = self.client.search_repositories(query=query, sort=sort, order=direction)
         
-        return [{
+        result = [{
             'name': repo.name,
             'updated_at': repo.updated_at,
             'clone_url': repo.clone_url,
             'default_branch': repo.default_branch,
             'private': repo.private
         } for repo in repos]
+        
+        self.cache.put(cache_key, [{**repo, 'updated_at': repo['updated_at'].isoformat()} for repo in result])
+        self._repositories[(sort, direction)] = result
+        return list(result)
     
     def clone_repository(self, repo_name: str, repo_data: Dict) -> Optional[str]:
         """Clone a repository to local storage."""
         repo_path = os.path.join(self.clone_dir, repo_name)
         
         # Skip if already cloned
-        if os.path.exists(repo_path):
+        if os.path.isdir(os.path.join(repo_path, '.git')):
             print(f"Repository {repo_name} already cloned, updating...")
             try:
                 repo = git.Repo(repo_path)
-                repo.remotes.origin.pull()
+                # Clones have no working tree to merge into; fetching updates the refs git log reads
+                repo.git.fetch('--all', '--prune', '--filter=blob:none')
                 return repo_path
             except Exception as e:
-                print(f"Error updating repository {repo_name}: {str(e)}")
-                return None
+                # A broken or partial clone is recovered by cloning it again
+                print(f"Error updating repository {repo_name}: {str(e)}, cloning it again")
+                self.cleanup(repo_path)
+        elif os.path.exists(repo_path):
+            # Leftover of an interrupted clone; git refuses to clone into a non-empty directory
+            self.cleanup(repo_path)
         
         # Clone repository
         try:
@@ -65,7 +94,8 @@ class GitHubProvider(GitProvider):
                 # Insert token into clone URL for authentication
                 clone_url = clone_url.replace('https://', f'https://{self.token}@')
             
-            git.Repo.clone_from(clone_url, repo_path)
+            # Only history and trees are read, so skip blobs and the working tree
+            git.Repo.clone_from(clone_url, repo_path, multi_options=['--filter=blob:none', '--no-checkout'])
             return repo_path
         except Exception as e:
             print(f"Error cloning repository {repo_name}: {str(e)}")
@@ -81,71 +111,90 @@ class GitHubProvider(GitProvider):
             since_date = start_date.strftime("%Y-%m-%d") if start_date else "1970-01-01"
             until_date = end_date.strftime("%Y-%m-%d")
             
+            # Walk only the requested branch's mainline, or every ref when no branch is given
+            revisions = ['--first-parent', f'origin/{branch}'] if branch else ['--all']
+            
+            # Reuse an earlier result when none of the walked refs have moved
+            ref_shas = subprocess.run(['git', '-C', repo_path, 'rev-parse', revisions[-1]], capture_output=True, text=True)
+            cache_key = f"commits-{' '.join(revisions)}-{since_date}-{until_date}-{ref_shas.stdout}"
+            if ref_shas.returncode == 0:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return [{**commit, 'date': datetime.fromtimestamp(commit['date'])} for commit in cached]
+            
             # Construct git log command
             cmd = [
                 'git', '-C', repo_path, 'log',
-                '--all',
+                *revisions,
                 f'--since={since_date}',
                 f'--until={until_date}',
-                '--pretty=format:%ad %H %s',
-                '--date=format:%Y-%m-%d',
+                # Headers start with a record separator and use unit separators between fields,
+                # so they can't be confused with file names
+                f'--pretty=format:{RECORD_SEPARATOR}%H{FIELD_SEPARATOR}%at{FIELD_SEPARATOR}%s',
                 '--name-only',
+                '--no-renames',  # Rename detection diffs blob contents and is not needed for file names
                 '--', '*.tf', '*.tfvars'
             ]
             
-            # Execute git log command
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                print(f"Error running git log: {result.stderr}")
-                return []
-            
-            # Process the output
+            # Execute git log command and parse its output as it streams in
             commits = []
             current_commit = None
             current_files = []
             
-            for line in result.stdout.splitlines():
-                if not line.strip():
-                    continue
-                    
-                # Check if this is a commit header (date, hash, message)
-                parts = line.split(' ', 2)
-                if len(parts) >= 3 and len(parts[1]) == 40:  # SHA-1 hash is 40 chars
-                    if current_commit:
-                        current_commit['files'] = current_files
-                        commits.append(current_commit)
-                        current_files = []
-                    
-                    current_commit = {
-                        'date': datetime.strptime(parts[0], '%Y-%m-%d'),
-                        'sha': parts[1],
-                        'message': parts[2]
-                    }
-                else:
-                    # This is a file name
-                    if current_commit and line.strip():
-                        current_files.append(line.strip())
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1024 * 1024) as proc:
+                for line in proc.stdout:
+                    line = line.rstrip('\n')
+                    if not line:
+                        continue
+                        
+                    if line.startswith(RECORD_SEPARATOR):
+                        # Commit header (hash, author timestamp, subject)
+                        if current_commit:
+                            current_commit['files'] = current_files
+                            commits.append(current_commit)
+                            current_files = []
+                        
+                        sha, timestamp, message = line[1:].split(FIELD_SEPARATOR, 2)
+                        current_commit = {
+                            'date': datetime.fromtimestamp(int(timestamp)),
+                            'sha': sha,
+                            'message': message
+                        }
+                    elif current_commit:
+                        # This is a file name
+                        current_files.append(line)
+                
+                stderr = proc.stderr.read()
+            
+            if proc.returncode != 0:
+                print(f"Error running git log in {repo_path}: {stderr}")
+                return []
             
             # Add the last commit
             if current_commit:
                 current_commit['files'] = current_files
                 commits.append(current_commit)
             
+            if ref_shas.returncode == 0:
+                self.cache.put(cache_key, [{**commit, 'date': commit['date'].timestamp()} for commit in commits])
             return commits
             
         except Exception as e:
-            print(f"Error getting commits: {str(e)}")
+            print(f"Error getting commits from {repo_path}: {str(e)}")
             return []
     
     def handle_rate_limit(self) -> None:
         """Handle GitHub API rate limits."""
-        rate_limit = self.client.get_rate_limit()
-        if rate_limit.core.remaining == 0:
-            reset_time = rate_limit.core.reset
-            wait_time = (reset_time - datetime.now()).total_seconds()
-            if wait_time > 0:
-                print(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
-                time.sleep(wait_time)
+        # Serialize checks so concurrent callers wait on a single reset instead of each polling
+        with self._rate_limit_lock:
+            # PyGithub tracks the X-RateLimit-* headers of the last response, so this
+            # only calls the /rate_limit endpoint before the first request
+            remaining, _ = self.client.rate_limiting
+            if remaining == 0:
+                wait_time = self.client.rate_limiting_resettime - time.time()
+                if wait_time > 0:
+                    print(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
+                    time.sleep(wait_time)
     
     def get_commit_files(self, commit) -> List[str]:
         """Get list of files changed in a commit."""